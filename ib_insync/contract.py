@@ -24,8 +24,8 @@ class Contract(Object):
         Bond(secIdType='ISIN', secId='US03076KAA60')
     """
     defaults = ibapi.contract.Contract().__dict__
-    __slots__ = list(defaults.keys()) + \
-            ['comboLegsCount', 'underCompPresent']  # bug in decoder.py
+    __slots__ = tuple(defaults) + \
+            ('comboLegsCount', 'underCompPresent')  # bug in decoder.py
     __init__ = Object.__init__
 
     @staticmethod
@@ -35,21 +35,7 @@ class Contract(Object):
         or a general Contract if secType is not given.
         """
         secType = kwargs.pop('secType', '')
-        cls = {
-            '': Contract,
-            'STK': Stock,
-            'OPT': Option,
-            'FUT': Future,
-            'CASH': Forex,
-            'IND': Index,
-            'CFD': CFD,
-            'BOND': Bond,
-            'CMDTY': Commodity,
-            'FOP': FuturesOption,
-            'FUND': MutualFund,
-            'IOPT': Warrant
-        }[secType]
-        return cls(**kwargs)
+        return _secTypeClasses[secType](**kwargs)
 
     def __eq__(self, other):
         return (self.conId and isinstance(other, Contract) and
@@ -188,3 +174,18 @@ class Warrant(Contract):
     def __init__(self, **kwargs):
         Contract.__init__(self, secType='IOPT', **kwargs)
 
+
+_secTypeClasses = {
+    '': Contract,
+    'STK': Stock,
+    'OPT': Option,
+    'FUT': Future,
+    'CASH': Forex,
+    'IND': Index,
+    'CFD': CFD,
+    'BOND': Bond,
+    'CMDTY': Commodity,
+    'FOP': FuturesOption,
+    'FUND': MutualFund,
+    'IOPT': Warrant
+}
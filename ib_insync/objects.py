@@ -1,4 +1,7 @@
+import inspect
+import keyword
 from collections import namedtuple
+from operator import attrgetter
 
 import ibapi.scanner
 import ibapi.contract
@@ -36,7 +39,16 @@ class Object:
     * A default equality testing that compares attributes.
     """
     __slots__ = ()
+    # the defaults are compiled into the constructor when the class is
+    # created, changing them afterwards has no effect
     defaults = {}
+    _defaultItems = ()
+
+    # specialized subclasses can set these to get a compiled constructor
+    # with required positional arguments, see _compileInit
+    _initArgs = ()
+    _initAliases = {}
+    _initOverrides = {}
 
     def __init__(self, *args, **kwargs):
         """
@@ -44,17 +56,34 @@ class Object:
         If an attribute is not given it will take its value from the
         'defaults' class member. If an attribute is given both positionally
         and as keyword, the keyword wins.
+
+        Subclasses that use ``__init__ = Object.__init__`` get a
+        constructor with the same behavior that is compiled specifically
+        for their defaults, see ``_compileInit``.
         """
-        for k, v in self.__class__.defaults.items():
+        for k, v in self._defaultItems:
             setattr(self, k, v)
         for k, v in zip(self.__class__.defaults, args):
             setattr(self, k, v)
         for k, v in kwargs.items():
             setattr(self, k, v)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._defaultItems = tuple(cls.defaults.items())
+        if '_initArgs' in cls.__dict__:
+            cls.__init__ = _compileInit(cls, cls._initArgs,
+                    cls._initAliases, cls._initOverrides)
+        elif cls.__dict__.get('__init__') is Object.__init__:
+            cls.__init__ = _compileInit(cls)
+        elif ('__init__' not in cls.__dict__ and 'defaults' in cls.__dict__
+                and hasattr(cls.__init__, '_compiled')):
+            # the inherited constructor is compiled for the parent's defaults
+            cls.__init__ = _compileInit(cls, *cls.__init__._compiled)
+
     def __repr__(self):
         clsName = self.__class__.__name__
-        kwargs = ', '.join(f'{k}={v!r}' for k, v in self.nonDefaults().items())
+        kwargs = ', '.join(f'{k}={v!r}' for k, v in self._nonDefaultItems())
         return f'{clsName}({kwargs})'
 
     __str__ = __repr__
@@ -98,45 +127,127 @@ class Object:
         """
         Get a dictionary of all attributes that differ from the default.
         """
-        nonDefaults = {}
-        for k, d in self.__class__.defaults.items():
+        return dict(self._nonDefaultItems())
+
+    def _nonDefaultItems(self, skip=None):
+        """
+        Yield (key, value) pairs of the attributes that differ from the
+        default, leaving out the attribute named by ``skip``.
+        """
+        for k, d in self._defaultItems:
             v = getattr(self, k)
-            if v != d:
-                nonDefaults[k] = v
-        return nonDefaults
+            if v != d and k != skip:
+                yield k, v
+
+
+def _compileInit(cls, args=(), aliases=None, overrides=None):
+    """
+    Compile a constructor for the given class that assigns every
+    attribute from 'defaults' with a straight assignment. The default
+    values are bound as closure variables so that no dict is involved.
+    Positional and keyword values are then applied just as in
+    ``Object.__init__``, which also provides the public signature.
+
+    For specialized subclasses a sequence of required positional ``args``
+    can be given, with ``aliases`` mapping argument names to attribute
+    names. The ``overrides`` dict gives attribute values that are fixed
+    for the class. Giving a fixed attribute or the target of an alias as
+    keyword is then a TypeError, and the public signature is
+    ``(self, *args, **kwargs)`` with the given args.
+    """
+    aliases = aliases or {}
+    overrides = overrides or {}
+    argAttrs = [aliases.get(a, a) for a in args]
+    fields = [k for k in cls.defaults
+            if k not in argAttrs and k not in overrides]
+    if not all(k.isidentifier() and not keyword.iskeyword(k)
+            for k in list(fields) + list(overrides)):
+        if args:
+            raise ValueError(
+                    f'Cannot compile constructor for {cls.__qualname__}: '
+                    'not all attributes are valid argument names')
+        return Object.__init__
+    values = [cls.defaults[k] for k in fields]
+    body = ''.join(f'        self.{k} = _d_{k}\n' for k in fields)
+    if args:
+        fixed = frozenset(overrides) | frozenset(aliases.values())
+        values += list(overrides.values()) + [fixed, cls.__qualname__]
+        closure = [f'_d_{k}' for k in fields + list(overrides)] + \
+                ['_fixed', '_name']
+        params = ['self', *args]
+        body += ''.join(f'        self.{k} = _d_{k}\n' for k in overrides)
+        body += ''.join(
+                f'        self.{k} = {a}\n' for a, k in zip(args, argAttrs))
+        body += (
+            '        for k, v in kwargs.items():\n'
+            '            if k in _fixed:\n'
+            '                raise TypeError(f"{_name}.__init__() got "\n'
+            '                        f"multiple values for keyword "\n'
+            '                        f"argument \'{k}\'")\n'
+            '            setattr(self, k, v)\n')
+    else:
+        values.append(tuple(cls.defaults))
+        closure = [f'_d_{k}' for k in fields] + ['_fields']
+        params = ['self', '*args']
+        body += (
+            '        for k, v in zip(_fields, args):\n'
+            '            setattr(self, k, v)\n'
+            '        for k, v in kwargs.items():\n'
+            '            setattr(self, k, v)\n')
+    src = (
+        f'def makeInit({", ".join(closure)}):\n'
+        f'    def __init__({", ".join(params)}, **kwargs):\n'
+        f'{body}'
+        '    return __init__\n')
+    namespace = {}
+    exec(src, namespace)
+    init = namespace['makeInit'](*values)
+    if args:
+        P = inspect.Parameter
+        init.__signature__ = inspect.Signature(
+                [P('self', P.POSITIONAL_OR_KEYWORD)] +
+                [P(a, P.POSITIONAL_OR_KEYWORD) for a in args] +
+                [P('kwargs', P.VAR_KEYWORD)])
+    else:
+        init.__doc__ = Object.__init__.__doc__
+        init.__signature__ = inspect.signature(Object.__init__)
+    init.__module__ = cls.__module__
+    init.__qualname__ = f'{cls.__qualname__}.__init__'
+    init._compiled = (args, aliases, overrides)
+    return init
 
 
 class ContractDetails(Object):
     defaults = ibapi.contract.ContractDetails().__dict__
     defaults['summary'] = None
-    __slots__ = list(defaults.keys()) + \
-            ['secIdListCount']  # bug in ibapi decoder
+    __slots__ = tuple(defaults) + \
+            ('secIdListCount',)  # bug in ibapi decoder
     __init__ = Object.__init__
 
 class ContractDescription(Object):
     defaults = ibapi.contract.ContractDescription().__dict__
     defaults['contract'] = None
-    __slots__ = defaults.keys()
+    __slots__ = tuple(defaults)
     __init__ = Object.__init__
 
 class ComboLeg(Object):
     defaults = ibapi.contract.ComboLeg().__dict__
-    __slots__ = defaults.keys()
+    __slots__ = tuple(defaults)
     __init__ = Object.__init__
 
 class UnderComp(Object):
     defaults = ibapi.contract.UnderComp().__dict__
-    __slots__ = defaults.keys()
+    __slots__ = tuple(defaults)
     __init__ = Object.__init__
 
 class OrderComboLeg(Object):
     defaults = ibapi.order.OrderComboLeg().__dict__
-    __slots__ = defaults.keys()
+    __slots__ = tuple(defaults)
     __init__ = Object.__init__
 
 class OrderState(Object):
     defaults = ibapi.order_state.OrderState().__dict__
-    __slots__ = defaults.keys()
+    __slots__ = tuple(defaults)
     __init__ = Object.__init__
 
 class OrderStatus(Object):
@@ -153,7 +264,7 @@ class OrderStatus(Object):
         'whyHeld': '',
         'mktCapPrice': 0.0,
         'lastLiquidity': 0 }
-    __slots__ = defaults.keys()
+    __slots__ = tuple(defaults)
     __init__ = Object.__init__
     OrderStates = ('PendingSubmit', 'PendingCancel', 'PreSubmitted',
             'Submitted', 'ApiPending', 'ApiCancelled', 'Cancelled',
@@ -161,60 +272,66 @@ class OrderStatus(Object):
     # ApiPending is undocumented, it can be returned from req(All)OpenOrders
 for k in OrderStatus.OrderStates:
     setattr(OrderStatus, k, k)
-OrderStatus.ActiveStates = (OrderStatus.PendingSubmit, OrderStatus.ApiPending,
-        OrderStatus.PreSubmitted, OrderStatus.Submitted)
+OrderStatus.DoneStates = frozenset([OrderStatus.Filled,
+        OrderStatus.Cancelled, OrderStatus.ApiCancelled])
+OrderStatus.ActiveStates = frozenset([OrderStatus.PendingSubmit,
+        OrderStatus.ApiPending, OrderStatus.PreSubmitted,
+        OrderStatus.Submitted])
 
 class ScannerSubscription(Object):
     defaults = ibapi.scanner.ScannerSubscription().__dict__
-    __slots__ = defaults.keys()
+    __slots__ = tuple(defaults)
     __init__ = Object.__init__
 
 class SoftDollarTier(Object):
     defaults = ibapi.softdollartier.SoftDollarTier().__dict__
-    __slots__ = defaults.keys()
+    __slots__ = tuple(defaults)
     __init__ = Object.__init__
 
 class Execution(Object):
     defaults = ibapi.execution.Execution().__dict__
-    __slots__ = defaults.keys()
+    __slots__ = tuple(defaults)
     __init__ = Object.__init__
 
 class CommissionReport(Object):
     defaults = ibapi.commission_report.CommissionReport().__dict__
-    __slots__ = defaults.keys()
+    __slots__ = tuple(defaults)
     __init__ = Object.__init__
 
 class ExecutionFilter(Object):
     defaults = ibapi.execution.ExecutionFilter().__dict__
-    __slots__ = defaults.keys()
+    __slots__ = tuple(defaults)
     __init__ = Object.__init__
 
 class BarData(Object):
     defaults = ibapi.common.BarData().__dict__
-    __slots__ = defaults.keys()
+    __slots__ = tuple(defaults)
     __init__ = Object.__init__
 
 class RealTimeBar(Object):
     defaults = ibapi.common.RealTimeBar().__dict__
-    __slots__ = defaults.keys()
+    __slots__ = tuple(defaults)
     __init__ = Object.__init__
 
 class HistogramData(Object):
     defaults = ibapi.common.HistogramData().__dict__
-    __slots__ = defaults.keys()
+    __slots__ = tuple(defaults)
     __init__ = Object.__init__
 
 class NewsProvider(Object):
     defaults = ibapi.common.NewsProvider().__dict__
-    __slots__ = defaults.keys()
+    __slots__ = tuple(defaults)
     __init__ = Object.__init__
 
 class DepthMktDataDescription(Object):
     defaults = ibapi.common.DepthMktDataDescription().__dict__
-    __slots__ = defaults.keys()
+    __slots__ = tuple(defaults)
     __init__ = Object.__init__
 
 
+_fillShares = attrgetter('execution.shares')
+
+
 class Trade(namedtuple('Trade',
         'contract order orderStatus fills log')):
     __slots__ = ()
@@ -225,11 +342,17 @@ class Trade(namedtuple('Trade',
         """
         return self.orderStatus.status in OrderStatus.ActiveStates
 
+    def isDone(self):
+        """
+        Is this trade filled or cancelled?
+        """
+        return self.orderStatus.status in OrderStatus.DoneStates
+
     def filled(self):
         """
         Number of shares filled.
         """
-        return sum(f.execution.shares for f in self.fills)
+        return sum(map(_fillShares, self.fills))
 
     def remaining(self):
         """
@@ -1,3 +1,5 @@
+import sys
+
 import ibapi
 
 from ib_insync.objects import Object
@@ -12,53 +14,51 @@ class Order(Object):
     https://interactivebrokers.github.io/tws-api/available_orders.html
     """
     defaults = ibapi.order.Order().__dict__
-    __slots__ = list(defaults.keys()) + \
-            ['sharesAllocation', 'orderComboLegsCount',
-                'smartComboRoutingParamsCount', 'conditionsSize']  # bugs in decoder.py
+    __slots__ = tuple(defaults) + \
+            ('sharesAllocation', 'orderComboLegsCount',
+                'smartComboRoutingParamsCount', 'conditionsSize')  # bugs in decoder.py
     __init__ = Object.__init__
 
     def __repr__(self):
-        attrs = self.nonDefaults()
-        if self.__class__ is not Order:
-            attrs.pop('orderType', None)
+        # specialized orders imply the orderType
+        skip = 'orderType' if self.__class__ is not Order else None
         clsName = self.__class__.__name__
-        kwargs = ', '.join(f'{k}={v!r}' for k, v in attrs.items())
+        kwargs = ', '.join(
+                f'{k}={v!r}' for k, v in self._nonDefaultItems(skip))
         return f'{clsName}({kwargs})'
 
     __str__ = __repr__
 
-    def __eq__(self, other):
-        return self is other
-
-    def __hash__(self):
-        return id(self)
+    # orders compare and hash by identity, overriding the value-based
+    # equality of Object with the C-level implementations of object;
+    # object.__eq__ returns NotImplemented for anything but the same
+    # order, so equality with non-Order operands is delegated to the
+    # other operand's __eq__
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
 
 
 class LimitOrder(Order):
     __slots__ = ()
-    def __init__(self, action, totalQuantity, lmtPrice, **kwargs):
-        Order.__init__(self, orderType='LMT', action=action,
-                totalQuantity=totalQuantity, lmtPrice=lmtPrice, **kwargs)
+    _initArgs = ('action', 'totalQuantity', 'lmtPrice')
+    _initOverrides = {'orderType': 'LMT'}
 
 
 class MarketOrder(Order):
     __slots__ = ()
-    def __init__(self, action, totalQuantity, **kwargs):
-        Order.__init__(self, orderType='MKT', action=action,
-                totalQuantity=totalQuantity, **kwargs)
+    _initArgs = ('action', 'totalQuantity')
+    _initOverrides = {'orderType': 'MKT'}
 
 
 class StopOrder(Order):
     __slots__ = ()
-    def __init__(self, action, totalQuantity, stopPrice, **kwargs):
-        Order.__init__(self, orderType='STP', action=action,
-                totalQuantity=totalQuantity, auxPrice=stopPrice, **kwargs)
+    _initArgs = ('action', 'totalQuantity', 'stopPrice')
+    _initAliases = {'stopPrice': 'auxPrice'}
+    _initOverrides = {'orderType': 'STP'}
 
 
 class StopLimitOrder(Order):
     __slots__ = ()
-    def __init__(self, action, totalQuantity, lmtPrice, stopPrice, **kwargs):
-        Order.__init__(self, orderType='STP LMT', action=action,
-                totalQuantity=totalQuantity, lmtPrice=lmtPrice,
-                auxPrice=stopPrice, **kwargs)
-
+    _initArgs = ('action', 'totalQuantity', 'lmtPrice', 'stopPrice')
+    _initAliases = {'stopPrice': 'auxPrice'}
+    _initOverrides = {'orderType': sys.intern('STP LMT')}
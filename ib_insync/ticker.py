@@ -66,15 +66,11 @@ class Ticker(Object):
         'askGreeks': None,
         'lastGreeks': None,
         'modelGreeks': None }
-    __slots__ = defaults.keys()
+    __slots__ = tuple(defaults)
     __init__ = Object.__init__
 
     def __repr__(self):
-        attrs = {}
-        for k, d in self.__class__.defaults.items():
-            v = getattr(self, k)
-            if v != d and not isNan(v):
-                attrs[k] = v
+        attrs = {k: v for k, v in self._nonDefaultItems() if not isNan(v)}
         # ticks can grow too large to display
         attrs.pop('ticks')
         attrs.pop('domTicks')
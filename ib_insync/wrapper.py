@@ -1,3 +1,4 @@
+import sys
 import asyncio
 import logging
 import datetime
@@ -194,7 +195,7 @@ class Wrapper(EWrapper):
         else:
             contract = Contract(**contract.__dict__)
             order = Order(**order.__dict__)
-            orderStatus = OrderStatus(status=orderState.status)
+            orderStatus = OrderStatus(status=sys.intern(orderState.status))
             if order.softDollarTier:
                 order.softDollarTier = SoftDollarTier(
                         **order.softDollarTier.__dict__)
@@ -217,6 +218,8 @@ class Wrapper(EWrapper):
             mktCapPrice=0.0, lastLiquidity=0):
         trade = self.trades.get(orderId)
         if trade:
+            # interned to match the OrderStatus state constants by identity
+            status = sys.intern(status)
             statusChanged = trade.orderStatus.status != status
             trade.orderStatus.update(status=status, filled=filled,
                     remaining=remaining, avgFillPrice=avgFillPrice,